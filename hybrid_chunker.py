@@ -20,12 +20,17 @@ ARCHITECTURE:
 """
 
 import logging
+import queue
+import threading
 import time
-from typing import List, Dict, Any, Optional, Set
-from docling_core.transforms.chunker.hybrid_chunker import HybridChunker
-from docling_core.transforms.chunker import BaseChunk
-from docling_core.types.doc.document import DoclingDocument
-from table_serializer import serialize_table_from_chunk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from docling_core.transforms.chunker import BaseChunk
+    from docling_core.transforms.chunker.hybrid_chunker import HybridChunker
+    from docling_core.types.doc.document import DoclingDocument
 
 logger = logging.getLogger(__name__)
 
@@ -36,22 +41,70 @@ __all__ = [
 ]
 
 
+# Ready HybridChunker instances keyed by (max_tokens, merge_peers, tokenizer
+# identity). Building one loads a tokenizer (hundreds of ms), which dominates
+# small-document latency when paid per request; the lock makes the cache safe
+# under FastAPI's threadpool. LRU-bounded because max_tokens is a raw client
+# form field — an unbounded dict would let every distinct value pin a new
+# chunker (and tokenizer) for the life of the process.
+_chunker_cache: OrderedDict = OrderedDict()
+_CHUNKER_CACHE_MAX = 8
+_chunker_cache_lock = threading.Lock()
+
+# Embedding-model prefix added to every chunk; plain concatenation below
+# avoids re-parsing an f-string template per chunk on the hot path
+_SEARCH_PREFIX = "search_document: "
+
+# content_type decode table for the 3-bit label mask built in
+# extract_chunk_metadata (bit 2: table, bit 1: list_item, bit 0:
+# section_header). Indexing by mask applies the table > list > heading
+# priority without any set membership tests.
+_CONTENT_TYPE_BY_MASK = (
+    "text", "heading", "list", "list",
+    "table", "table", "table", "table",
+)
+
+# Direct label -> content_type dispatch for the single-doc_item fast path,
+# where no priority resolution is needed. Both tables live at module scope
+# so the per-chunk path never rebuilds them; keep them in sync when adding
+# labels.
+_LABEL_TO_TYPE = {
+    "table": "table",
+    "list_item": "list",
+    "section_header": "heading",
+}
+
+
 def _create_chunker(
     max_tokens: int,
     merge_peers: bool,
     tokenizer: Optional[Any]
-) -> HybridChunker:
+) -> "HybridChunker":
     """
-    Initialize HybridChunker with common parameters.
-    
+    Get a HybridChunker with common parameters (cached across calls).
+
     Args:
         max_tokens: Maximum tokens per chunk
         merge_peers: Whether to merge undersized successive chunks with same headings
         tokenizer: Optional tokenizer (uses HybridChunker's built-in if None)
-        
+
     Returns:
         Initialized HybridChunker instance
     """
+    # Deferred so importing this module stays cheap; /api/parse-pdf-only
+    # workers never pay for docling_core's chunker stack
+    from docling_core.transforms.chunker.hybrid_chunker import HybridChunker
+
+    # Tokenizer objects aren't hashable; id() is stable here because callers
+    # (TokenizerManager / DoclingVLMService) keep their tokenizers cached
+    cache_key = (max_tokens, merge_peers, id(tokenizer) if tokenizer is not None else None)
+    with _chunker_cache_lock:
+        chunker = _chunker_cache.get(cache_key)
+        if chunker is not None:
+            _chunker_cache.move_to_end(cache_key)
+            logger.debug("Reusing cached HybridChunker for %s", cache_key)
+            return chunker
+
     # Build chunker parameters
     chunker_params = {
         "max_tokens": max_tokens,
@@ -73,14 +126,70 @@ def _create_chunker(
     
     chunker = HybridChunker(**chunker_params)
     logger.debug(f"HybridChunker initialized with max_tokens={max_tokens}, merge_peers={merge_peers}")
-    
+
+    with _chunker_cache_lock:
+        _chunker_cache[cache_key] = chunker
+        while len(_chunker_cache) > _CHUNKER_CACHE_MAX:
+            _chunker_cache.popitem(last=False)
+
     return chunker
 
 
-def _process_chunk_text(chunker: HybridChunker, chunk: BaseChunk) -> tuple[str, str]:
+def _prefetched(iterable: Iterable[Any], n: int = 4) -> Iterator[Any]:
+    """
+    Run ``iterable`` on a background thread, buffering up to ``n`` items.
+
+    HybridChunker.chunk() is a generator that does tokenization work per
+    item; running it on a producer thread overlaps that work with the
+    consumer's metadata extraction and serialization. The bounded queue
+    caps memory; exceptions are re-raised in the consumer. If the consumer
+    stops iterating early (GeneratorExit, or an exception in its loop
+    body), the producer notices via the stop event and exits instead of
+    blocking forever on the full queue — otherwise every abandoned
+    iterator would leak a thread plus the buffered chunks and the source
+    document pinned by its frame.
+    """
+    items: queue.Queue = queue.Queue(maxsize=n)
+    sentinel = object()
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        # Bounded put that gives up once the consumer is gone
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce():
+        try:
+            for item in iterable:
+                if not _put(item):
+                    return
+        except BaseException as exc:  # propagate into the consumer
+            _put((sentinel, exc))
+        else:
+            _put(sentinel)
+
+    threading.Thread(target=_produce, daemon=True).start()
+    try:
+        while True:
+            item = items.get()
+            if item is sentinel:
+                return
+            if isinstance(item, tuple) and len(item) == 2 and item[0] is sentinel:
+                raise item[1]
+            yield item
+    finally:
+        # Runs on normal exhaustion, GeneratorExit, and consumer errors
+        stop.set()
+
+
+def _process_chunk_text(chunker: "HybridChunker", chunk: "BaseChunk") -> tuple[str, str]:
     contextualized_text = chunker.contextualize(chunk)
-    prefixed_text = f"search_document: {contextualized_text}"
-    return contextualized_text, prefixed_text
+    return contextualized_text, _SEARCH_PREFIX + contextualized_text
 
 
 def _log_chunk_statistics(
@@ -112,65 +221,110 @@ def _log_chunk_statistics(
         logger.info(f"Chunk statistics: avg_length={avg_length:.0f} chars")
 
 
-def extract_chunk_metadata(chunk: BaseChunk) -> Dict[str, Any]:
+def extract_chunk_metadata(
+    chunk: "BaseChunk",
+    meta_cache: Optional[Dict[int, tuple]] = None
+) -> Dict[str, Any]:
     """
     Extract metadata from a BaseChunk object.
-    
+
     Args:
         chunk: BaseChunk object from HybridChunker
-        
+        meta_cache: Optional per-document memo keyed by id(chunk.meta); merged
+            chunks frequently share meta blocks, so the doc_items walk runs
+            once per unique block. Entries store the meta object alongside its
+            metadata so the id stays pinned — CPython reuses addresses of
+            freed objects, so a bare id key can silently match a different
+            meta block. Callers must scope the dict to a single document.
+
     Returns:
         Dictionary with metadata including content_type, heading_path, pages, etc.
     """
+    # Bind meta once; every further access below is a single getattr with
+    # a default instead of a hasattr probe plus a second lookup
+    meta = chunk.meta
+    if meta_cache is not None:
+        entry = meta_cache.get(id(meta))
+        # Identity check guards against a freed meta's address being reused
+        if entry is not None and entry[0] is meta:
+            return entry[1]
+
     metadata = {}
-    
-    # Extract content type from doc_items
-    content_type = "text"  # default
-    if hasattr(chunk.meta, "doc_items") and chunk.meta.doc_items:
-        types = set()
-        for item in chunk.meta.doc_items:
-            if hasattr(item, "label"):
-                types.add(item.label)
-        
-        if "table" in types:
-            content_type = "table"
-        elif "list_item" in types:
-            content_type = "list"
-        elif "section_header" in types:
-            content_type = "heading"
-    
+    items = getattr(meta, "doc_items", None)
+
+    if not items:
+        # Fast path: nothing to aggregate
+        content_type = "text"
+        page_numbers = set()
+        doc_items_count = 0
+    elif len(items) == 1:
+        # Fast path: most text chunks carry a single doc_item, where the
+        # priority resolution collapses to one dict lookup
+        item = items[0]
+        content_type = _LABEL_TO_TYPE.get(getattr(item, "label", None), "text")
+        page_numbers = set()
+        for prov in getattr(item, "prov", ()):
+            page_no = getattr(prov, "page_no", None)
+            if page_no is not None:
+                page_numbers.add(page_no)
+        doc_items_count = 1
+    else:
+        # Single pass over doc_items: labels, page numbers, and the item
+        # count all come from the same traversal instead of three separate
+        # walks. Only three labels matter for classification, so they're
+        # collected as bits in a small mask instead of a per-chunk set of
+        # label objects; the add method is bound once outside the loop —
+        # with tens of thousands of doc_items the repeated attribute
+        # lookups are the dominant interpreter cost in here.
+        mask = 0
+        page_numbers = set()
+        doc_items_count = 0
+        add_page = page_numbers.add
+        for item in items:
+            doc_items_count += 1
+            label = getattr(item, "label", None)
+            if label is not None:
+                mask |= (
+                    ((label == "table") << 2)
+                    | ((label == "list_item") << 1)
+                    | (label == "section_header")
+                )
+            for prov in getattr(item, "prov", ()):
+                page_no = getattr(prov, "page_no", None)
+                if page_no is not None:
+                    add_page(page_no)
+
+        # Resolve content type by priority (table > list > heading > text)
+        content_type = _CONTENT_TYPE_BY_MASK[mask]
+
     metadata["content_type"] = content_type
-    
+
     # Extract heading path (breadcrumb)
-    if hasattr(chunk.meta, "headings") and chunk.meta.headings:
-        metadata["heading_path"] = " > ".join(chunk.meta.headings)
-    
-    # Extract page numbers
-    page_numbers: Set[int] = set()
-    if hasattr(chunk.meta, "doc_items") and chunk.meta.doc_items:
-        for item in chunk.meta.doc_items:
-            if hasattr(item, "prov"):
-                for prov in item.prov:
-                    if hasattr(prov, "page_no") and prov.page_no is not None:
-                        page_numbers.add(prov.page_no)
-    
+    headings = getattr(meta, "headings", None)
+    if headings:
+        metadata["heading_path"] = " > ".join(headings)
+
     if page_numbers:
-        metadata["pages"] = sorted(list(page_numbers))
-    
+        # sorted() takes any iterable; no need to copy the set first
+        metadata["pages"] = sorted(page_numbers)
+
     # Extract table data if present (simplified - just mark as table)
     if content_type == "table":
         # Could extract detailed table structure here if needed
         metadata["has_table_structure"] = True
-    
+
     # Count doc items for debugging
-    if hasattr(chunk.meta, "doc_items") and chunk.meta.doc_items:
-        metadata["doc_items_count"] = len(chunk.meta.doc_items)
-    
+    if doc_items_count:
+        metadata["doc_items_count"] = doc_items_count
+
+    if meta_cache is not None:
+        meta_cache[id(meta)] = (meta, metadata)
+
     return metadata
 
 
 def chunk_document(
-    document: DoclingDocument,
+    document: "DoclingDocument",
     max_tokens: int = 512,
     merge_peers: bool = True,
     tokenizer: Optional[Any] = None,
@@ -231,57 +385,97 @@ def chunk_document(
     
     # Initialize chunker (shared logic)
     chunker = _create_chunker(max_tokens, merge_peers, tokenizer)
-    
+
+    # Per-document memo for extract_chunk_metadata (see its docstring)
+    meta_cache: Dict[int, tuple] = {}
+
     chunks = []
+    raw_chunks: List[Any] = []  # kept only when include_full_metadata
+    table_jobs: List[tuple] = []  # (chunk_index, chunk, section_title)
     tables_serialized = 0
     tables_failed = 0
-    
-    # Process document with HybridChunker
-    for chunk_idx, chunk in enumerate(chunker.chunk(document)):
+
+    # Process document with HybridChunker; the prefetch thread keeps the
+    # chunker's tokenization running while we post-process each chunk
+    for chunk_idx, chunk in enumerate(_prefetched(chunker.chunk(document))):
         # Process text (shared logic)
         contextualized_text, prefixed_text = _process_chunk_text(chunker, chunk)
         
         # Extract section title from headings (most specific heading)
         section_title = None
-        if hasattr(chunk.meta, "headings") and chunk.meta.headings:
-            section_title = chunk.meta.headings[-1]  # Use last (most specific) heading
+        headings = getattr(chunk.meta, "headings", None)
+        if headings:
+            section_title = headings[-1]  # Use last (most specific) heading
         
         # Extract curated metadata
-        metadata = extract_chunk_metadata(chunk)
-        
-        # Handle table serialization if enabled
-        final_text = prefixed_text
-        if serialize_tables:
-            if metadata.get("content_type") == "table":
-                # Serialize table from chunk's doc_items (pass document for reference resolution)
-                serialized = serialize_table_from_chunk(chunk, document=document)
-                if serialized:
-                    # Include section title with serialized table (with blank line for readability)
-                    if section_title:
-                        final_text = f"search_document: {section_title}\n\n{serialized}"
-                    else:
-                        final_text = f"search_document: {serialized}"
-                    tables_serialized += 1
-                else:
-                    tables_failed += 1
+        metadata = extract_chunk_metadata(chunk, meta_cache=meta_cache)
         
+        # Table serialization is deferred and batched after the loop so
+        # independent tables can run in parallel; remember which chunks
+        # need it
+        if serialize_tables and metadata.get("content_type") == "table":
+            table_jobs.append((chunk_idx, chunk, section_title))
+
         # Create chunk data dictionary
         chunk_data = {
-            "text": final_text,
+            "text": prefixed_text,
             "section_title": section_title,
             "chunk_index": chunk_idx,
             "metadata": metadata
         }
         
-        # Optionally include complete Docling metadata
+        # Complete Docling metadata is dumped in one batch after the loop
         if include_full_metadata:
-            chunk_data["full_metadata"] = chunk.model_dump()
-        
+            raw_chunks.append(chunk)
+
         chunks.append(chunk_data)
         
         if chunk_idx % 10 == 0 and chunk_idx > 0:
             logger.debug(f"Processed {chunk_idx} chunks...")
-    
+
+    # Serialize tables in parallel: reference resolution through the document
+    # graph is independent per table, so table-heavy documents (financial
+    # reports etc.) no longer pay for it serially
+    if table_jobs:
+        from table_serializer import serialize_tables_from_chunks
+
+        # Strided batches, one per worker: each worker serializes its share
+        # of the tables through the batch entry point, which reuses a single
+        # scratch buffer across them
+        n_workers = min(4, len(table_jobs))
+        batches = [table_jobs[i::n_workers] for i in range(n_workers)]
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            batch_outputs = list(pool.map(
+                lambda batch: serialize_tables_from_chunks(
+                    [chunk for _, chunk, _ in batch], document=document
+                ),
+                batches
+            ))
+        flat_jobs = [job for batch in batches for job in batch]
+        serialized_tables = [out for outputs in batch_outputs for out in outputs]
+        for (chunk_idx, _, section_title), serialized in zip(flat_jobs, serialized_tables):
+            if serialized:
+                # Include section title with serialized table (with blank line for readability)
+                if section_title:
+                    chunks[chunk_idx]["text"] = _SEARCH_PREFIX + section_title + "\n\n" + serialized
+                else:
+                    chunks[chunk_idx]["text"] = _SEARCH_PREFIX + serialized
+                tables_serialized += 1
+            else:
+                tables_failed += 1
+
+    # Dump full metadata as one batch: TypeAdapter builds the pydantic
+    # serializer once, where per-chunk model_dump() repeats the schema
+    # dispatch for every call. mode="json" yields plain JSON-ready types
+    # in the same pydantic-core pass, so response encoding never has to
+    # re-walk the graph converting enums/dates
+    if raw_chunks:
+        from pydantic import TypeAdapter
+
+        adapter = TypeAdapter(List[type(raw_chunks[0])])
+        for chunk_data, dumped in zip(chunks, adapter.dump_python(raw_chunks, mode="json")):
+            chunk_data["full_metadata"] = dumped
+
     # Log statistics (shared logic)
     _log_chunk_statistics(chunks, start_time, text_field="text", is_native=False)
     
@@ -1,10 +1,22 @@
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import shutil
 import tempfile
-from pathlib import Path
 from typing import Optional
 
 from fastapi import FastAPI, UploadFile, File, HTTPException, Form
-from docling_service import DoclingVLMService
+from fastapi.responses import Response
+from docling_service import get_service
+
+# C-accelerated JSON for the chunk responses; falls back to FastAPI's
+# default encoder when unavailable
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -22,12 +34,31 @@ app = FastAPI(
 # Global service instance
 docling_service = None
 
+# Number of reusable upload scratch files (bounds concurrent uploads)
+UPLOAD_POOL_SIZE = 8
+
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize VLM service on startup"""
     global docling_service
-    docling_service = DoclingVLMService()
+    docling_service = get_service()
+
+    # Pre-create a pool of scratch paths for uploads: handlers check one
+    # out, overwrite it in place, and return it, instead of paying
+    # tempfile create/unlink syscalls on every request
+    app.state.upload_dir = tempfile.mkdtemp(prefix="vlm-uploads-")
+    app.state.upload_paths = asyncio.Queue()
+    for i in range(UPLOAD_POOL_SIZE):
+        app.state.upload_paths.put_nowait(
+            os.path.join(app.state.upload_dir, f"upload-{i}.pdf")
+        )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Remove the upload scratch directory"""
+    shutil.rmtree(app.state.upload_dir, ignore_errors=True)
 
 
 @app.get("/")
@@ -59,30 +90,40 @@ async def parse_pdf(file: UploadFile = File(...)):
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files supported")
     
-    # Save uploaded file temporarily
-    temp_path = None
+    # Check out a reusable scratch path and stream the upload into it in
+    # 1 MiB pieces so large uploads never sit fully buffered in memory
+    temp_path = await app.state.upload_paths.get()
     try:
-        contents = await file.read()
-        
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            temp_file.write(contents)
-            temp_path = temp_file.name
-        
+        # Hash while streaming so the service's content-hash cache lookup
+        # doesn't have to read the whole file back from disk
+        hasher = hashlib.blake2b(digest_size=32)
+        with open(temp_path, 'wb') as temp_file:
+            while chunk := await file.read(1 << 20):
+                hasher.update(chunk)
+                temp_file.write(chunk)
+
         # Parse with VLM
-        result = docling_service.parse_pdf(temp_path)
-        
+        result = await docling_service.parse_pdf_async(temp_path, content_hash=hasher.hexdigest())
+
         if not result.get("success"):
             raise HTTPException(status_code=500, detail=result.get("error"))
-        
-        return {
-            "filename": file.filename,
-            "document": result.get("document")
-        }
-        
+
+        # The document is already JSON-encoded by the service; splice it into
+        # the response envelope as raw bytes so FastAPI doesn't re-serialize
+        # the (potentially huge) document structure.
+        payload = (
+            b'{"filename":' + json.dumps(file.filename).encode()
+            + b',"document":' + result["document_json"].encode() + b'}'
+        )
+        return Response(content=payload, media_type="application/json")
+
     finally:
-        # Cleanup
-        if temp_path and Path(temp_path).exists():
-            Path(temp_path).unlink()
+        # Drop the file contents now, then return the path to the pool
+        try:
+            os.truncate(temp_path, 0)
+        except OSError:
+            pass
+        app.state.upload_paths.put_nowait(temp_path)
 
 
 @app.post("/api/parse-and-chunk")
@@ -144,31 +185,41 @@ async def parse_and_chunk(
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files supported")
     
-    # Save uploaded file temporarily
-    temp_path = None
+    # Check out a reusable scratch path and stream the upload into it in
+    # 1 MiB pieces so large uploads never sit fully buffered in memory
+    temp_path = await app.state.upload_paths.get()
     try:
-        contents = await file.read()
-        
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            temp_file.write(contents)
-            temp_path = temp_file.name
-        
+        # Hash while streaming so the service's content-hash cache lookup
+        # doesn't have to read the whole file back from disk
+        hasher = hashlib.blake2b(digest_size=32)
+        with open(temp_path, 'wb') as temp_file:
+            while chunk := await file.read(1 << 20):
+                hasher.update(chunk)
+                temp_file.write(chunk)
+
         # Parse with VLM
-        logger.info(f"Parsing PDF: {file.filename}")
-        result = docling_service.parse_pdf(temp_path)
+        logger.debug("Parsing PDF: %s", file.filename)
+        result = await docling_service.parse_pdf_async(temp_path, content_hash=hasher.hexdigest())
         
         if not result.get("success"):
             raise HTTPException(status_code=500, detail=result.get("error"))
         
-        # Get the ConversionResult object (not the dict)
-        # We need to re-parse to get the actual DoclingDocument object
-        logger.info(f"Re-converting to get DoclingDocument object for chunking")
-        conversion_result = docling_service.converter.convert(temp_path)
-        document = conversion_result.document
-        
-        # Chunk the document
-        logger.info(f"Chunking document with max_tokens={max_tokens}, merge_peers={merge_peers}")
-        chunks = docling_service.chunk_document(
+        # Reuse the DoclingDocument from the parse above instead of running
+        # the VLM pipeline a second time. Cache hits return the serialized
+        # form only, so fall back to a fresh conversion in that case — on
+        # the service's GPU worker, so it queues behind other requests'
+        # conversions instead of hitting the vLLM engine concurrently.
+        document = result.get("document")
+        if document is None:
+            logger.debug("Re-converting to get DoclingDocument object for chunking")
+            document = await docling_service.convert_async(temp_path)
+
+        # Chunk the document on a worker thread: chunking is CPU-bound for
+        # hundreds of milliseconds on large documents, and blocking the
+        # event loop here would stall every other request's upload I/O
+        logger.debug("Chunking document with max_tokens=%s, merge_peers=%s", max_tokens, merge_peers)
+        chunks = await asyncio.to_thread(
+            docling_service.chunk_document,
             document=document,
             max_tokens=max_tokens,
             merge_peers=merge_peers,
@@ -176,16 +227,27 @@ async def parse_and_chunk(
             serialize_tables=serialize_tables
         )
         
-        return {
+        response_body = {
             "filename": file.filename,
             "num_pages": result.get("num_pages"),
             "chunks": chunks
         }
+
+        # The chunk dicts are already JSON-ready (full_metadata is dumped
+        # in mode="json"), so one orjson pass replaces FastAPI's
+        # jsonable_encoder walk plus json.dumps — the payload graph is
+        # traversed once, in compiled code
+        if orjson is not None:
+            return Response(content=orjson.dumps(response_body), media_type="application/json")
+        return response_body
         
     finally:
-        # Cleanup
-        if temp_path and Path(temp_path).exists():
-            Path(temp_path).unlink()
+        # Drop the file contents now, then return the path to the pool
+        try:
+            os.truncate(temp_path, 0)
+        except OSError:
+            pass
+        app.state.upload_paths.put_nowait(temp_path)
 
 
 if __name__ == "__main__":
@@ -25,203 +25,350 @@ USAGE:
             serialized_text = serialize_table_from_chunk(chunk)
 """
 
+import array
+import io
 import logging
+import operator
+import re
+import threading
+import weakref
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from docling_core.transforms.chunker import BaseChunk
 
+# Docling's cells are all one concrete class, so a pointer-identity type
+# check beats a hasattr MRO walk on the per-cell path; fall back to the
+# attribute probe if the class ever moves
+try:
+    from docling_core.types.doc.document import TableCell
+except ImportError:  # pragma: no cover - older docling_core layouts
+    TableCell = None
+
 logger = logging.getLogger(__name__)
 
+# Snapshot the debug state once at import: the service configures logging
+# a single time at startup, so a static flag lets the per-table hot path
+# skip even the no-op logger.debug dispatch when running at INFO
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+_dbg = logger.debug if _DEBUG else (lambda *args, **kwargs: None)
+
 # Export public API
 __all__ = [
     'serialize_table_from_chunk',
+    'serialize_tables_from_chunks',
     'extract_table_structure',
     'format_table_as_keyvalue',
 ]
 
 
+# Extracted structures keyed by id(table_data). A merged-peers chunking run
+# emits several chunks that reference the same table, and re-walking the
+# grid for each one is pure waste. id() keys are kept honest by a weakref
+# finalizer that evicts the entry when the TableData object is collected.
+_STRUCT_CACHE: OrderedDict = OrderedDict()
+_STRUCT_CACHE_MAX = 128
+
+# Guards both module caches below: serialize_tables_from_chunks fans table
+# batches out to a thread pool, and OrderedDict get/move_to_end/popitem
+# sequences are not atomic across threads
+_cache_lock = threading.Lock()
+
+
+def _evict_struct(key: int) -> None:
+    """weakref.finalize callback: drop a struct-cache entry under the lock."""
+    with _cache_lock:
+        _STRUCT_CACHE.pop(key, None)
+
+# Data row of a markdown table: pipe-delimited line that is not a
+# separator row (|---|:--:|). Compiled once; the C regex engine replaces
+# the per-line count('|')/all(c in '|-: ') scans of the old parser.
+_MD_TABLE_ROW = re.compile(r'^\s*\|(?!\s*[-:\s|]+\s*$)(.+)\|\s*$', re.M)
+
+# Joined caption strings keyed by id(captions): chunks of the same table
+# share the captions list, so the join runs once per table, not per chunk.
+# Lists don't support weakrefs, so entries pin the list itself alongside
+# the joined string — a reused id from a freed list of a previous document
+# fails the identity check instead of returning that document's caption.
+_CAPTION_CACHE: OrderedDict = OrderedDict()
+_CAPTION_CACHE_MAX = 256
+
+
+if TableCell is not None:
+    def _cell_text(cell: Any) -> str:
+        """Cell text via a C-level type identity check."""
+        return cell.text if type(cell) is TableCell else str(cell)
+else:
+    def _cell_text(cell: Any) -> str:
+        """Cell text via attribute probe (TableCell import unavailable)."""
+        return cell.text if hasattr(cell, 'text') else str(cell)
+
+
 def extract_table_structure(table_data: Any) -> Optional[Dict[str, Any]]:
     """
-    Extract structured data from Docling's TableData object.
-    
-    Accesses the grid structure directly to get headers and rows.
-    
+    Extract structured data from Docling's TableData object (memoized).
+
+    Accesses the grid structure directly to get headers and rows. Repeated
+    calls for the same TableData object return the cached structure.
+
     Args:
         table_data: TableData object from item.data
-        
+
     Returns:
         Dictionary with 'headers', 'rows', and grid information
         Returns None if extraction fails
     """
     if not table_data:
         return None
-    
+
+    key = id(table_data)
+    with _cache_lock:
+        cached = _STRUCT_CACHE.get(key)
+        if cached is not None:
+            _STRUCT_CACHE.move_to_end(key)
+            return cached
+
+    result = _extract_table_structure(table_data)
+    if result is not None:
+        with _cache_lock:
+            _STRUCT_CACHE[key] = result
+            while len(_STRUCT_CACHE) > _STRUCT_CACHE_MAX:
+                _STRUCT_CACHE.popitem(last=False)
+        try:
+            weakref.finalize(table_data, _evict_struct, key)
+        except TypeError:
+            # Object doesn't support weakrefs; the LRU bound still caps growth
+            pass
+    return result
+
+
+def _extract_from_list_grid(table_data: Any) -> Optional[Dict[str, Any]]:
+    """Grid is a plain list: rows of cells, strings, or row objects."""
+    grid = table_data.grid
+    if not grid:
+        return None
+
+    if isinstance(grid[0], list):
+        # Probe the first cell once and pick one accessor for the whole
+        # grid — cells in a TableData grid are homogeneous, and the
+        # per-cell hasattr/isinstance chain dominated on wide tables
+        first = grid[0][0] if grid[0] else None
+        # map() with a C-level callable (attrgetter/str) iterates each row
+        # without per-element bytecode dispatch
+        if (TableCell is not None and type(first) is TableCell) or hasattr(first, 'text'):
+            get_text = operator.attrgetter('text')
+            extracted_rows = [list(map(get_text, row)) for row in grid]
+        elif isinstance(first, str):
+            extracted_rows = [list(row) for row in grid]
+        else:
+            extracted_rows = [list(map(str, row)) for row in grid]
+    else:
+        _dbg("Grid first item type: %s", type(grid[0]))
+        # Try to get text from objects
+        extracted_rows = []
+        for row_item in grid:
+            if isinstance(row_item, list):
+                extracted_rows.append(row_item)
+            elif hasattr(row_item, 'cells'):
+                # It's a row object with cells
+                extracted_rows.append([_cell_text(cell) for cell in row_item.cells])
+
+    if not extracted_rows:
+        _dbg("Grid list format not recognized. Sample: %.200s", grid[:2])
+        return None
+    return {
+        'headers': extracted_rows[0],
+        'rows': extracted_rows[1:] if len(extracted_rows) > 1 else [],
+    }
+
+
+def _extract_via_dataframe(table_data: Any) -> Optional[Dict[str, Any]]:
+    """Grid exposes export_to_dataframe()."""
+    grid = table_data.grid
+    if not hasattr(grid, 'export_to_dataframe'):
+        return None
+    try:
+        df = grid.export_to_dataframe()
+    except Exception as e:
+        _dbg("export_to_dataframe failed: %s", e)
+        return None
+    if df is None or df.empty:
+        _dbg("export_to_dataframe returned empty/None")
+        return None
+
+    # Keep the DataFrame itself on the structure; rows are only
+    # materialized as Python lists if the vectorized rendering below
+    # can't produce lines, so the common path never pays for
+    # df.values.tolist() on a frame it is about to re-serialize
     result = {
-        'headers': None,
+        'headers': df.columns.tolist(),
         'rows': [],
+        'dataframe': df,
     }
-    
+
+    # While the DataFrame is in hand, render the key-value lines with
+    # vectorized column ops — header prefixing and cell stripping run in
+    # C instead of R*C Python f-strings downstream
+    import numpy as np
+
+    str_df = df.astype(str)
+    columns = []
+    for pos, header in enumerate(str(h).strip() for h in df.columns):
+        if header:
+            col = str_df.iloc[:, pos].str.strip()
+            columns.append(np.where(col != '', header + ': ' + col, ''))
+    if columns:
+        result['lines'] = [
+            ', '.join(v for v in row_vals if v)
+            for row_vals in zip(*columns)
+            if any(row_vals)
+        ]
+    else:
+        # All headers empty: fall back to list rows for the generic formatter
+        result['rows'] = df.values.tolist()
+    return result
+
+
+def _extract_via_list_export(table_data: Any) -> Optional[Dict[str, Any]]:
+    """Grid exposes export_to_list()."""
+    grid = table_data.grid
+    if not hasattr(grid, 'export_to_list'):
+        return None
+    try:
+        rows = grid.export_to_list()
+    except Exception as e:
+        _dbg("export_to_list failed: %s", e)
+        return None
+    if not rows:
+        _dbg("export_to_list returned empty")
+        return None
+    return {
+        'headers': rows[0],
+        'rows': rows[1:] if len(rows) > 1 else [],
+    }
+
+
+def _extract_via_cells(table_data: Any) -> Optional[Dict[str, Any]]:
+    """Grid exposes a flat cells iterable with row/col coordinates."""
+    grid = table_data.grid
+    if not hasattr(grid, 'cells'):
+        return None
     try:
-        # Check if table_data has grid
+        # Typed int buffers expose the buffer protocol, so the fancy
+        # indexing below consumes them without boxing each index
+        rows_idx = array.array('i')
+        cols_idx = array.array('i')
+        texts = []
+        for cell in grid.cells:
+            if hasattr(cell, 'row') and hasattr(cell, 'col'):
+                rows_idx.append(cell.row)
+                cols_idx.append(cell.col)
+                texts.append(_cell_text(cell))
+
+        if not rows_idx:
+            _dbg("Cell iteration produced no rows")
+            return None
+
+        # Scatter into a dense (rows x cols) object array in one
+        # fancy-indexed assignment instead of building a dict-of-dicts and
+        # sorting rows and columns separately; gaps become empty strings,
+        # which also keeps ragged rows column-aligned
+        import numpy as np
+
+        arr = np.empty((max(rows_idx) + 1, max(cols_idx) + 1), dtype=object)
+        arr[:] = ''
+        arr[rows_idx, cols_idx] = texts
+        all_rows = arr.tolist()
+
+        return {
+            'headers': all_rows[0],
+            'rows': all_rows[1:] if len(all_rows) > 1 else [],
+        }
+    except Exception as e:
+        _dbg("Cell iteration failed: %s", e)
+        return None
+
+
+def _extract_via_markdown(table_data: Any) -> Optional[Dict[str, Any]]:
+    """Last resort: parse the table's own markdown export."""
+    if not hasattr(table_data, 'export_to_markdown'):
+        _dbg("TableData has no export_to_markdown method")
+        return None
+    try:
+        markdown = table_data.export_to_markdown()
+    except Exception as e:
+        _dbg("export_to_markdown failed: %s", e)
+        return None
+    if not markdown or '|' not in markdown:
+        _dbg("export_to_markdown returned no markdown or no pipes")
+        return None
+
+    # Parse markdown table rows in one regex pass
+    rows = [
+        [c.strip() for c in m.group(1).split('|')]
+        for m in _MD_TABLE_ROW.finditer(markdown)
+    ]
+    if not rows:
+        _dbg("No data lines found in markdown")
+        return None
+    return {
+        'headers': rows[0],
+        'rows': rows[1:] if len(rows) > 1 else [],
+    }
+
+
+def _candidate_extractors(table_data: Any, grid: Any):
+    """Yield extraction strategies in probe order for this table shape."""
+    if grid is None:
         if not hasattr(table_data, 'grid'):
-            logger.debug("TableData has no 'grid' attribute")
-            logger.debug(f"TableData attributes: {[attr for attr in dir(table_data) if not attr.startswith('_')][:20]}")
-            # Try direct markdown export as fallback
-        elif not table_data.grid:
-            logger.debug("TableData.grid is None")
-        else:
-            # Access grid structure
-            grid = table_data.grid
-            logger.debug(f"Found grid structure (type: {type(grid)}, repr: {type(grid).__name__})")
-            
-            # Check if grid is already a list (plain data structure)
-            if isinstance(grid, list):
-                # If it's a list of lists, it's the table data directly!
-                if grid and len(grid) > 0:
-                    # Check if first item is a list (rows)
-                    if isinstance(grid[0], list):
-                        # Extract text from TableCell objects
-                        extracted_rows = []
-                        for row in grid:
-                            extracted_row = []
-                            for cell in row:
-                                # Extract text from TableCell objects
-                                if hasattr(cell, 'text'):
-                                    extracted_row.append(cell.text)
-                                elif isinstance(cell, str):
-                                    extracted_row.append(cell)
-                                else:
-                                    extracted_row.append(str(cell))
-                            extracted_rows.append(extracted_row)
-                        
-                        result['headers'] = extracted_rows[0] if extracted_rows else None
-                        result['rows'] = extracted_rows[1:] if len(extracted_rows) > 1 else []
-                        return result
-                    else:
-                        logger.debug(f"Grid first item type: {type(grid[0])}")
-                        # Try to get text from objects
-                        rows_from_objects = []
-                        for row_item in grid:
-                            if isinstance(row_item, list):
-                                rows_from_objects.append(row_item)
-                            elif hasattr(row_item, 'cells'):
-                                # It's a row object with cells
-                                row = [cell.text if hasattr(cell, 'text') else str(cell) for cell in row_item.cells]
-                                rows_from_objects.append(row)
-                        
-                        if rows_from_objects:
-                            result['headers'] = rows_from_objects[0] if rows_from_objects else None
-                            result['rows'] = rows_from_objects[1:] if len(rows_from_objects) > 1 else []
-                            return result
-                
-                # If we get here, grid format wasn't recognized
-                logger.debug(f"Grid list format not recognized. Sample: {str(grid[:2])[:200]}")
-                # Continue to try other methods below
-            
-            # Try method: export_to_dataframe (if available)
-            if hasattr(grid, 'export_to_dataframe'):
-                logger.debug("Trying export_to_dataframe...")
-                try:
-                    df = grid.export_to_dataframe()
-                    if df is not None and not df.empty:
-                        result['headers'] = df.columns.tolist()
-                        result['rows'] = df.values.tolist()
-                        return result
-                    else:
-                        logger.debug("export_to_dataframe returned empty/None")
-                except Exception as e:
-                    logger.debug(f"export_to_dataframe failed: {e}")
-            else:
-                logger.debug("Grid has no export_to_dataframe method")
-            
-            # Try method: export_to_list
-            if hasattr(grid, 'export_to_list'):
-                logger.debug("Trying export_to_list...")
-                try:
-                    rows = grid.export_to_list()
-                    if rows and len(rows) > 0:
-                        result['headers'] = rows[0] if rows else None
-                        result['rows'] = rows[1:] if len(rows) > 1 else []
-                        return result
-                    else:
-                        logger.debug("export_to_list returned empty")
-                except Exception as e:
-                    logger.debug(f"export_to_list failed: {e}")
-            else:
-                logger.debug("Grid has no export_to_list method")
-            
-            # Try method: Iterate cells
-            if hasattr(grid, 'cells'):
-                logger.debug("Trying cell iteration...")
-                try:
-                    cells = grid.cells
-                    rows_dict = {}
-                    
-                    for cell in cells:
-                        if hasattr(cell, 'row') and hasattr(cell, 'col'):
-                            row_idx = cell.row
-                            col_idx = cell.col
-                            text = cell.text if hasattr(cell, 'text') else str(cell)
-                            
-                            if row_idx not in rows_dict:
-                                rows_dict[row_idx] = {}
-                            rows_dict[row_idx][col_idx] = text
-                    
-                    if rows_dict:
-                        # Convert to list format
-                        sorted_rows = sorted(rows_dict.items())
-                        all_rows = []
-                        for _, row_cells in sorted_rows:
-                            sorted_cells = sorted(row_cells.items())
-                            row = [text for _, text in sorted_cells]
-                            all_rows.append(row)
-                        
-                        if all_rows:
-                            result['headers'] = all_rows[0]
-                            result['rows'] = all_rows[1:] if len(all_rows) > 1 else []
-                            return result
-                    else:
-                        logger.debug("Cell iteration produced no rows")
-                            
-                except Exception as e:
-                    logger.debug(f"Cell iteration failed: {e}")
-            else:
-                logger.debug("Grid has no cells attribute")
-        
-        # Try method: Direct table text via export_to_markdown
-        if hasattr(table_data, 'export_to_markdown'):
-            logger.debug("Trying export_to_markdown...")
-            try:
-                markdown = table_data.export_to_markdown()
-                if markdown and '|' in markdown:
-                    # Parse markdown table
-                    lines = [l.strip() for l in markdown.strip().split('\n') if l.strip()]
-                    data_lines = [l for l in lines if l.count('|') > 1 and not all(c in '|-: ' for c in l)]
-                    
-                    if data_lines:
-                        rows = []
-                        for line in data_lines:
-                            cells = [c.strip() for c in line.strip('|').split('|')]
-                            rows.append(cells)
-                        
-                        if rows:
-                            result['headers'] = rows[0]
-                            result['rows'] = rows[1:] if len(rows) > 1 else []
-                            return result
-                        else:
-                            logger.debug("Markdown parsing produced no rows")
-                    else:
-                        logger.debug("No data lines found in markdown")
-                else:
-                    logger.debug("export_to_markdown returned no markdown or no pipes")
-            except Exception as e:
-                logger.debug(f"export_to_markdown failed: {e}")
+            _dbg("TableData has no 'grid' attribute")
+            if _DEBUG:
+                # dir() allocates hundreds of strings; only pay for it when
+                # debug output is actually emitted
+                _dbg("TableData attributes: %s",
+                             [attr for attr in dir(table_data) if not attr.startswith('_')][:20])
         else:
-            logger.debug("TableData has no export_to_markdown method")
-        
+            _dbg("TableData.grid is None")
+    else:
+        _dbg("Found grid structure (type: %s, repr: %s)", type(grid), type(grid).__name__)
+        if isinstance(grid, list):
+            yield _extract_from_list_grid
+        yield _extract_via_dataframe
+        yield _extract_via_list_export
+        yield _extract_via_cells
+    yield _extract_via_markdown
+
+
+# Winning extractor per (type(table_data), type(grid)) pair. Grids of the
+# same classes always take the same branch, so after the first probe every
+# later table skips the whole isinstance/hasattr ladder.
+_DISPATCH: Dict[tuple, Any] = {}
+
+
+def _extract_table_structure(table_data: Any) -> Optional[Dict[str, Any]]:
+    """Uncached worker behind extract_table_structure."""
+    grid = getattr(table_data, 'grid', None) or None
+    key = (type(table_data), type(grid))
+
+    fn = _DISPATCH.get(key)
+    if fn is not None:
+        try:
+            result = fn(table_data)
+        except Exception as e:
+            logger.warning("Failed to extract table structure: %s", e)
+            return None
+        if result is not None:
+            return result
+        # The cached strategy came up empty for this instance; re-probe
+
+    try:
+        for candidate in _candidate_extractors(table_data, grid):
+            result = candidate(table_data)
+            if result is not None:
+                _DISPATCH[key] = candidate
+                return result
     except Exception as e:
-        logger.warning(f"Failed to extract table structure: {e}")
-    
-    return result if result['headers'] or result['rows'] else None
+        logger.warning("Failed to extract table structure: %s", e)
+    return None
 
 
 def format_table_as_keyvalue(
@@ -252,32 +399,66 @@ def format_table_as_keyvalue(
         Region: North, Q1: 100, Q2: 150
         Region: South, Q1: 120, Q2: 180
     """
-    lines = []
-    
+    # Write rows straight into one growing buffer instead of collecting a
+    # list of line strings and joining at the end; halves peak memory on
+    # very large tables
+    return _format_table_into(io.StringIO(), headers, rows, caption)
+
+
+def _format_table_into(
+    buf: io.StringIO,
+    headers: List[str],
+    rows: List[List[str]],
+    caption: Optional[str]
+) -> str:
+    """Worker behind format_table_as_keyvalue; writes into a caller buffer."""
     # Add caption as prefix if available
     if caption:
-        lines.append(f"Table: {caption}")
-    
+        buf.write(f"Table: {caption}\n")
+
+    # Clean headers once; the row loop below only touches values. zip
+    # truncates to the shorter side, matching the old index-bounds check
+    # (short rows simply contribute fewer pairs).
+    clean_headers = [str(h).strip() for h in headers]
+
     # Format each row as key-value pairs
     for row in rows:
-        # Match headers with row values
-        pairs = []
-        for i, header in enumerate(headers):
-            value = row[i] if i < len(row) else ''
-            # Clean header and value
-            header_clean = str(header).strip()
-            value_clean = str(value).strip()
-            
-            if header_clean and value_clean:  # Skip empty headers or values
-                pairs.append(f"{header_clean}: {value_clean}")
-        
+        pairs = [
+            f"{h}: {v}"
+            for h, v in zip(clean_headers, (str(x).strip() for x in row))
+            if h and v  # Skip empty headers or values
+        ]
         if pairs:
-            lines.append(', '.join(pairs))
-    
-    return '\n'.join(lines)
+            buf.write(', '.join(pairs))
+            buf.write('\n')
+
+    return buf.getvalue().rstrip('\n')
 
 
-def serialize_table_from_chunk(chunk: BaseChunk, document: Any = None) -> Optional[str]:
+def _render_struct(
+    table_struct: Dict[str, Any],
+    caption: Optional[str],
+    buf: Optional[io.StringIO] = None
+) -> str:
+    """Render an extracted structure, preferring pre-rendered lines."""
+    lines = table_struct.get('lines')
+    if lines is not None:
+        if caption:
+            return '\n'.join([f"Table: {caption}", *lines])
+        return '\n'.join(lines)
+    return _format_table_into(
+        buf if buf is not None else io.StringIO(),
+        table_struct['headers'],
+        table_struct['rows'],
+        caption
+    )
+
+
+def serialize_table_from_chunk(
+    chunk: BaseChunk,
+    document: Any = None,
+    _buf: Optional[io.StringIO] = None
+) -> Optional[str]:
     """
     Serialize table from a chunk's doc_items.
     
@@ -298,23 +479,36 @@ def serialize_table_from_chunk(chunk: BaseChunk, document: Any = None) -> Option
         ...         if serialized:
         ...             print(serialized)
     """
-    if not hasattr(chunk, 'meta') or not hasattr(chunk.meta, 'doc_items') or not chunk.meta.doc_items:
+    doc_items = getattr(getattr(chunk, 'meta', None), 'doc_items', None)
+    if not doc_items:
         return None
-    
-    # Find table items in doc_items
-    table_item = None
-    for item in chunk.meta.doc_items:
-        if hasattr(item, 'label') and item.label == 'table':
-            table_item = item
-            break
-    
-    if not table_item:
+
+    # Find the first table item; one getattr per item instead of a
+    # hasattr probe followed by a second attribute access
+    table_item = next(
+        (item for item in doc_items if getattr(item, 'label', None) == 'table'),
+        None
+    )
+
+    if table_item is None:
         return None
     
-    # Extract caption
+    # Extract caption (memoized per captions list)
     caption = None
-    if hasattr(table_item, 'captions') and table_item.captions:
-        caption = ' '.join(str(cap) for cap in table_item.captions)
+    captions = getattr(table_item, 'captions', None)
+    if captions:
+        cid = id(captions)
+        with _cache_lock:
+            entry = _CAPTION_CACHE.get(cid)
+            if entry is not None and entry[0] is captions:
+                caption = entry[1]
+                _CAPTION_CACHE.move_to_end(cid)
+        if caption is None:
+            caption = ' '.join(str(cap) for cap in captions)
+            with _cache_lock:
+                _CAPTION_CACHE[cid] = (captions, caption)
+                while len(_CAPTION_CACHE) > _CAPTION_CACHE_MAX:
+                    _CAPTION_CACHE.popitem(last=False)
     
     # Check if table item has data
     if not hasattr(table_item, 'data'):
@@ -342,15 +536,10 @@ def serialize_table_from_chunk(chunk: BaseChunk, document: Any = None) -> Option
                                     
                                     if table_struct and table_struct.get('headers'):
                                         # Format and return
-                                        serialized = format_table_as_keyvalue(
-                                            headers=table_struct['headers'],
-                                            rows=table_struct['rows'],
-                                            caption=caption
-                                        )
-                                        return serialized
+                                        return _render_struct(table_struct, caption, _buf)
                     
             except Exception as e:
-                logger.warning(f"⚠️  Table serialization failed: {e}")
+                logger.warning("⚠️  Table serialization failed: %s", e)
         
         return None
     
@@ -364,10 +553,33 @@ def serialize_table_from_chunk(chunk: BaseChunk, document: Any = None) -> Option
         return None
     
     # Format as key-value pairs
-    serialized = format_table_as_keyvalue(
-        headers=table_struct['headers'],
-        rows=table_struct['rows'],
-        caption=caption
-    )
-    
-    return serialized
+    return _render_struct(table_struct, caption, _buf)
+
+
+def serialize_tables_from_chunks(
+    chunks: List[BaseChunk],
+    document: Any = None
+) -> List[Optional[str]]:
+    """
+    Serialize a batch of table chunks, reusing one scratch buffer.
+
+    Per-chunk serialization allocates a fresh StringIO each call; for a
+    document with many table chunks this churns the small-object
+    allocator. The batch path rewinds and reuses a single buffer between
+    chunks, so callers handing a worker thread its share of tables pay
+    for one buffer total.
+
+    Args:
+        chunks: BaseChunk objects (typically all classified as tables)
+        document: Optional document for table-reference resolution
+
+    Returns:
+        One serialized string (or None) per chunk, in input order
+    """
+    buf = io.StringIO()
+    results = []
+    for chunk in chunks:
+        buf.seek(0)
+        buf.truncate()
+        results.append(serialize_table_from_chunk(chunk, document=document, _buf=buf))
+    return results
@@ -46,9 +46,10 @@ def test_ultra_minimal():
     
     # Export to markdown
     markdown = result.document.export_to_markdown()
-    
+
     logger.info(f"✓ Success! Converted {len(result.document.pages)} pages")
-    logger.info(f"First 500 chars of output:\n{markdown[:500]}...")
+    # %-style defers the slice/format work entirely when DEBUG is off
+    logger.debug("Markdown preview (first 500 chars): %.500s", markdown)
     
     return result
 
@@ -89,12 +90,10 @@ def test_with_cuda():
     logger.info(f"Converting with CUDA: {test_pdf}")
     result = converter.convert(test_pdf)
     
-    # Export to different formats
-    markdown = result.document.export_to_markdown()
-    doc_dict = result.document.export_to_dict()
-    
+    # Both exports walk the whole document tree; read the counts off the
+    # document object directly instead of exporting twice
     logger.info(f"✓ Success! Converted {len(result.document.pages)} pages")
-    logger.info(f"Document has {len(doc_dict.get('texts', []))} text elements")
+    logger.info(f"Document has {len(result.document.texts)} text elements")
     
     return result
 
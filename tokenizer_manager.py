@@ -17,13 +17,18 @@ USAGE:
 
 import logging
 import os
+import re
+from collections import OrderedDict
 from typing import Optional, Any
-from functools import lru_cache
 import threading
 
 logger = logging.getLogger(__name__)
 
-# Thread lock for tokenizer loading
+# Valid model name: 1-200 characters, no leading or trailing slash. One
+# compiled fullmatch replaces the chain of per-call length/prefix guards.
+_VALID_MODEL_NAME = re.compile(r'(?!/).{1,200}(?<!/)', re.S)
+
+# Thread lock for the tokenizer cache (downloads use per-model locks)
 _tokenizer_lock = threading.Lock()
 
 
@@ -43,12 +48,27 @@ class TokenizerManager:
             cache_size: Maximum number of tokenizers to cache (default: 10)
         """
         self.cache_size = cache_size
-        self._load_tokenizer_cached = lru_cache(maxsize=cache_size)(self._load_tokenizer)
+        # Plain LRU dict instead of lru_cache around the bound method: the
+        # decorator approach built a fresh cache per instance (defeating
+        # the singleton), pinned self inside the cache, and paid
+        # _make_key/RLock overhead on every hit
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # One lock per model name so concurrent requests for different
+        # models download in parallel, while duplicate requests for the
+        # same model still wait for a single download
+        self._model_locks: dict = {}
+        self._locks_guard = threading.Lock()
         logger.debug(f"TokenizerManager initialized with cache_size={cache_size}")
     
     def _load_tokenizer(self, model_name: str) -> Any:
         """
-        Load a tokenizer from HuggingFace (internal, cached method).
+        Load a tokenizer from HuggingFace and store it in the cache.
+
+        The cache insert happens while the per-model lock is still held, so
+        a thread that waited out the download finds the tokenizer on its
+        double-check instead of starting a duplicate download.
         
         Args:
             model_name: HuggingFace model name
@@ -67,9 +87,18 @@ class TokenizerManager:
                 "transformers library is required. Install with: pip install transformers"
             )
         
-        with _tokenizer_lock:
+        with self._locks_guard:
+            model_lock = self._model_locks.setdefault(model_name, threading.Lock())
+
+        with model_lock:
+            # Another thread may have loaded this model while we waited
+            with _tokenizer_lock:
+                tokenizer = self._cache.get(model_name)
+            if tokenizer is not None:
+                return tokenizer
+
             logger.info(f"Loading tokenizer: {model_name}")
-            
+
             try:
                 # Use environment variable or default cache directory
                 cache_dir = os.environ.get('HF_CACHE_DIR', './cache/huggingface')
@@ -79,6 +108,13 @@ class TokenizerManager:
                     cache_dir=cache_dir
                 )
                 logger.info(f"✅ Tokenizer loaded: {model_name}")
+
+                # Publish before releasing the model lock so waiting
+                # threads hit the cache on their double-check
+                with _tokenizer_lock:
+                    self._cache[model_name] = tokenizer
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
                 return tokenizer
                 
             except Exception as e:
@@ -104,43 +140,52 @@ class TokenizerManager:
             ValueError: If model name is invalid or empty
             Exception: If tokenizer loading fails
         """
-        # Validate model name
-        if not model_name or not isinstance(model_name, str):
+        # Validate model name with a single C-level regex match
+        if not isinstance(model_name, str):
             raise ValueError("Model name must be a non-empty string")
-        
+
         model_name = model_name.strip()
-        
-        if not model_name:
-            raise ValueError("Model name cannot be empty")
-        
-        if len(model_name) > 200:
-            raise ValueError("Model name too long (max 200 chars)")
-        
-        if model_name.startswith('/') or model_name.endswith('/'):
-            raise ValueError("Invalid model name format")
+
+        if not _VALID_MODEL_NAME.fullmatch(model_name):
+            raise ValueError(
+                "Invalid model name: must be 1-200 characters and not "
+                "start or end with '/'"
+            )
         
         # Load from cache or fetch new
-        return self._load_tokenizer_cached(model_name)
-    
+        with _tokenizer_lock:
+            tokenizer = self._cache.get(model_name)
+            if tokenizer is not None:
+                self._cache.move_to_end(model_name)
+                self._cache_hits += 1
+                return tokenizer
+            self._cache_misses += 1
+
+        # _load_tokenizer caches the result itself, under the model lock
+        return self._load_tokenizer(model_name)
+
     def clear_cache(self):
         """Clear the tokenizer cache."""
-        self._load_tokenizer_cached.cache_clear()
+        with _tokenizer_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
         logger.info("Tokenizer cache cleared")
-    
+
     def get_cache_info(self) -> dict:
         """
         Get cache statistics.
-        
+
         Returns:
             Dictionary with cache hits, misses, and size
         """
-        cache_info = self._load_tokenizer_cached.cache_info()
-        return {
-            "hits": cache_info.hits,
-            "misses": cache_info.misses,
-            "size": cache_info.currsize,
-            "max_size": cache_info.maxsize
-        }
+        with _tokenizer_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "size": len(self._cache),
+                "max_size": self.cache_size
+            }
 
 
 # Global singleton instance